@@ -0,0 +1,43 @@
+"""Tests for audio preparation in the transcriber."""
+
+import numpy as np
+import pytest
+
+transcriber = pytest.importorskip("voice_transcriber.transcriber")
+prepare_audio = transcriber.Transcriber._prepare_audio
+
+
+def test_int16_is_scaled_to_unit_range():
+    audio = np.array([0, 16384, -32768], dtype=np.int16)
+    result = prepare_audio(audio, 16000)
+    assert result.dtype == np.float32
+    np.testing.assert_allclose(result, [0.0, 0.5, -1.0])
+
+
+def test_int32_is_scaled_to_unit_range():
+    audio = np.array([0, 2**30, -2**31], dtype=np.int32)
+    result = prepare_audio(audio, 16000)
+    assert result.dtype == np.float32
+    np.testing.assert_allclose(result, [0.0, 0.5, -1.0])
+
+
+def test_uint8_is_centred_and_scaled():
+    audio = np.array([128, 255, 0], dtype=np.uint8)
+    result = prepare_audio(audio, 16000)
+    assert result.dtype == np.float32
+    assert np.all(np.isfinite(result))
+    np.testing.assert_allclose(result, [0.0, 127 / 128, -1.0])
+
+
+def test_stereo_is_downmixed_to_mono():
+    audio = np.array([[0.5, -0.5], [1.0, 0.0]], dtype=np.float32)
+    result = prepare_audio(audio, 16000)
+    assert result.ndim == 1
+    np.testing.assert_allclose(result, [0.0, 0.5])
+
+
+def test_44100_hz_is_resampled_to_16000_hz():
+    audio = np.zeros(44100, dtype=np.int16)
+    result = prepare_audio(audio, 44100)
+    assert result.dtype == np.float32
+    assert len(result) == 16000
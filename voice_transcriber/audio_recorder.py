@@ -21,9 +21,16 @@ class AudioRecorder:
     
     def __init__(self):
         self.is_recording = False
-        self.audio_data = []
         self.recording_thread: Optional[threading.Thread] = None
         self.start_time = 0
+        self.stop_event = threading.Event()
+        
+        # Pre-allocated buffer for the longest allowed recording; audio
+        # chunks are written into it in place instead of being collected
+        # in a list and concatenated when recording stops
+        max_frames = int(config.max_recording_duration * config.sample_rate)
+        self.audio_buffer = np.empty((max_frames, config.channels), dtype=np.float32)
+        self.write_index = 0
         
     def start_recording(self) -> bool:
         """Start audio recording."""
@@ -32,7 +39,8 @@ class AudioRecorder:
             
         try:
             self.is_recording = True
-            self.audio_data = []
+            self.write_index = 0
+            self.stop_event.clear()
             self.start_time = time.time()
             
             # Start recording in a separate thread
@@ -50,30 +58,11 @@ class AudioRecorder:
     
     def stop_recording(self) -> Optional[str]:
         """Stop audio recording and save to temporary file."""
-        if not self.is_recording:
-            return None
-            
-        self.is_recording = False
-        
-        # Wait for recording thread to finish
-        if self.recording_thread:
-            self.recording_thread.join(timeout=1.0)
-        
-        recording_duration = time.time() - self.start_time
-        
-        # Check minimum duration
-        if recording_duration < config.min_recording_duration:
-            logger.info(f"Recording too short: {recording_duration:.2f}s")
-            return None
-            
-        if not self.audio_data:
-            logger.warning("No audio data recorded")
+        audio_array = self._finish_recording()
+        if audio_array is None:
             return None
             
         try:
-            # Convert to numpy array
-            audio_array = np.concatenate(self.audio_data, axis=0)
-            
             # Save to temporary file
             temp_file = tempfile.NamedTemporaryFile(suffix='.wav', delete=False)
             temp_filename = temp_file.name
@@ -82,17 +71,55 @@ class AudioRecorder:
             # Write WAV file
             wavfile.write(temp_filename, config.sample_rate, audio_array)
             
-            # Optionally save to recordings directory
-            if config.save_recordings:
-                self._save_recording_copy(audio_array)
-            
-            logger.info(f"Saved recording: {recording_duration:.2f}s, {temp_filename}")
+            logger.info(f"Saved recording: {temp_filename}")
             return temp_filename
             
         except Exception as e:
             logger.error(f"Failed to save recording: {e}")
             return None
     
+    def stop_recording_array(self) -> Optional[np.ndarray]:
+        """Stop audio recording and return the recorded samples."""
+        audio_array = self._finish_recording()
+        if audio_array is None:
+            return None
+        
+        # Copy out of the buffer, which is reused by the next recording
+        return audio_array.copy()
+    
+    def _finish_recording(self) -> Optional[np.ndarray]:
+        """Stop the recording thread and return a view of the recorded audio."""
+        if not self.is_recording:
+            return None
+            
+        self.is_recording = False
+        self.stop_event.set()
+        
+        # Wait for recording thread to finish
+        if self.recording_thread:
+            self.recording_thread.join(timeout=1.0)
+        
+        if self.write_index == 0:
+            logger.warning("No audio data recorded")
+            return None
+        
+        # Check minimum duration of the audio actually captured; wall-clock
+        # time also counts the stream start-up before any samples arrive
+        recording_duration = self.write_index / config.sample_rate
+        if recording_duration < config.min_recording_duration:
+            logger.info(f"Recording too short: {recording_duration:.2f}s")
+            return None
+        
+        # View of the recorded part of the buffer
+        audio_array = self.audio_buffer[:self.write_index]
+        
+        # Optionally save to recordings directory
+        if config.save_recordings:
+            self._save_recording_copy(audio_array)
+        
+        logger.info(f"Recording stopped: {recording_duration:.2f}s")
+        return audio_array
+    
     def _record_audio(self):
         """Record audio in chunks."""
         try:
@@ -101,7 +128,11 @@ class AudioRecorder:
                 if status:
                     logger.warning(f"Audio recording status: {status}")
                 if self.is_recording:
-                    self.audio_data.append(indata.copy())
+                    # indata is reused by sounddevice, so copy it into the buffer
+                    start = self.write_index
+                    end = min(start + frames, len(self.audio_buffer))
+                    self.audio_buffer[start:end] = indata[:end - start]
+                    self.write_index = end
             
             with sd.InputStream(
                 callback=audio_callback,
@@ -110,13 +141,10 @@ class AudioRecorder:
                 blocksize=config.chunk_size,
                 dtype=np.float32
             ):
-                while self.is_recording:
-                    sd.sleep(100)  # Sleep for 100ms
-                    
-                    # Check for maximum duration
-                    if time.time() - self.start_time > config.max_recording_duration:
-                        logger.info("Maximum recording duration reached")
-                        break
+                # Block until stop_recording() or the maximum duration
+                remaining = self.start_time + config.max_recording_duration - time.time()
+                if not self.stop_event.wait(timeout=max(0, remaining)):
+                    logger.info("Maximum recording duration reached")
                         
         except Exception as e:
             logger.error(f"Recording error: {e}")
@@ -5,9 +5,13 @@ from dataclasses import dataclass
 from typing import Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
-    """Configuration settings for the voice transcriber."""
+    """Configuration settings for the voice transcriber.
+    
+    Uses __slots__ for faster attribute access; assigning a field that
+    isn't declared here raises AttributeError.
+    """
     
     # Audio settings
     sample_rate: int = 16000
@@ -17,6 +21,8 @@ class Config:
     # Whisper settings
     model_name: str = "base"  # tiny, base, small, medium, large
     model_cache_dir: str = os.path.expanduser("~/.cache/whisper")
+    whisper_backend: str = "openai"  # openai (openai-whisper) or faster (faster-whisper)
+    use_vad: bool = False  # skip silence with Silero VAD (downloaded from GitHub on first use)
     
     # Hotkey settings
     hotkey: Tuple[str, ...] = ('ctrl', 'f1')
@@ -26,6 +32,14 @@ class Config:
     show_system_tray: bool = True
     show_notifications: bool = True
     
+    # Text insertion settings
+    use_clipboard_paste: bool = True  # paste with Ctrl+V instead of typing
+    type_interval: float = 0.01  # seconds between characters when typing
+    
+    # Text-to-speech settings
+    tts_cache_dir: str = os.path.expanduser("~/.cache/voice-copilot/tts")
+    tts_cache_max_files: int = 0  # keep audio of up to this many spoken texts; 0 disables the cache
+    
     # Recording settings
     min_recording_duration: float = 0.5  # seconds
     max_recording_duration: float = 30.0  # seconds
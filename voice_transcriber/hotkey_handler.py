@@ -1,14 +1,26 @@
 """Global hotkey handling for recording activation."""
 
 import logging
+import threading
 import time
-from typing import Callable, Optional
+from typing import Callable, Dict, Optional, Tuple
 from pynput import keyboard
 from .config import config
 
 
 logger = logging.getLogger(__name__)
 
+SPECIAL_KEY_NAMES = {
+    'ctrl_l': 'ctrl',
+    'ctrl_r': 'ctrl',
+    'alt_l': 'alt',
+    'alt_r': 'alt',
+    'shift_l': 'shift',
+    'shift_r': 'shift',
+    'cmd_l': 'cmd',
+    'cmd_r': 'cmd',
+}
+
 
 class HotkeyHandler:
     """Handles global hotkey detection for recording activation."""
@@ -19,7 +31,6 @@ class HotkeyHandler:
         self.on_release_callback: Optional[Callable] = None
         self.on_tts_press_callback: Optional[Callable] = None
         self.is_listening = False
-        self.pressed_keys = set()
         self.hotkey_states = {
             'record': False,  # Ctrl+F1 state
             'tts': False      # Ctrl+F2 state
@@ -27,6 +38,21 @@ class HotkeyHandler:
         self.last_tts_trigger = 0  # Debouncing for TTS
         self.tts_debounce_time = 0.5  # 500ms debounce
         
+        # Record release is deferred so key chatter doesn't stop recording
+        self.release_debounce_time = 0.02  # 20ms debounce
+        self.release_timer: Optional[threading.Timer] = None
+        self.release_lock = threading.Lock()
+        # The deferred release runs on a timer thread; this keeps it from
+        # overlapping a press callback on the listener thread
+        self.callback_lock = threading.Lock()
+        
+        # Pressed hotkey keys as a bitmask; each key used by a hotkey gets
+        # one bit, assigned in start()
+        self.key_bits: Dict[str, int] = {}
+        self.record_mask = 0
+        self.tts_mask = 0
+        self.pressed_bits = 0
+        
     def start(self, on_press: Callable, on_release: Callable, on_tts_press: Optional[Callable] = None) -> bool:
         """Start listening for hotkeys."""
         if self.is_listening:
@@ -35,6 +61,12 @@ class HotkeyHandler:
         self.on_press_callback = on_press
         self.on_release_callback = on_release
         self.on_tts_press_callback = on_tts_press
+        self.key_bits = {}
+        for key_name in config.hotkey + config.tts_hotkey:
+            self.key_bits.setdefault(key_name, 1 << len(self.key_bits))
+        self.record_mask = self._key_mask(config.hotkey)
+        self.tts_mask = self._key_mask(config.tts_hotkey)
+        self.pressed_bits = 0
         
         try:
             self.listener = keyboard.Listener(
@@ -45,11 +77,11 @@ class HotkeyHandler:
             self.is_listening = True
             
             hotkey_str = "+".join(config.hotkey)
-            logger.info(f"Started hotkey listener for: {hotkey_str}")
+            logger.info("Started hotkey listener for: %s", hotkey_str)
             return True
             
         except Exception as e:
-            logger.error(f"Failed to start hotkey listener: {e}")
+            logger.error("Failed to start hotkey listener: %s", e)
             return False
     
     def stop(self):
@@ -58,45 +90,59 @@ class HotkeyHandler:
             self.listener.stop()
             self.listener = None
         
+        with self.release_lock:
+            if self.release_timer:
+                self.release_timer.cancel()
+                self.release_timer = None
+        
         self.is_listening = False
-        self.pressed_keys.clear()
+        self.pressed_bits = 0
         logger.info("Stopped hotkey listener")
     
     def _on_key_press(self, key):
         """Handle key press events."""
         try:
-            key_name = self._get_key_name(key)
-            if key_name:
-                self.pressed_keys.add(key_name)
+            key_bit = self.key_bits.get(self._get_key_name(key))
+            if key_bit:
+                self.pressed_bits |= key_bit
                 
                 # Check if recording hotkey combination is pressed
                 if self._is_record_hotkey_pressed() and not self.hotkey_states['record']:
                     self.hotkey_states['record'] = True
-                    if self.on_press_callback:
-                        self.on_press_callback()
+                    
+                    # Pressed again before a pending release was delivered,
+                    # so treat it as chatter and keep recording
+                    with self.callback_lock:
+                        with self.release_lock:
+                            pending_release = self.release_timer
+                            self.release_timer = None
+                        if pending_release:
+                            pending_release.cancel()
+                        elif self.on_press_callback:
+                            self.on_press_callback()
                 
                 # Check if TTS hotkey combination is pressed  
                 elif self._is_tts_hotkey_pressed() and not self.hotkey_states['tts']:
-                    current_time = time.time()
+                    current_time = time.monotonic()
                     if current_time - self.last_tts_trigger > self.tts_debounce_time:
                         self.hotkey_states['tts'] = True
                         self.last_tts_trigger = current_time
                         if self.on_tts_press_callback:
                             self.on_tts_press_callback()
                         
-        except Exception as e:
-            logger.error(f"Error in key press handler: {e}")
+        except Exception:
+            logger.exception("Error in key press handler")
     
     def _on_key_release(self, key):
         """Handle key release events."""
         try:
-            key_name = self._get_key_name(key)
-            if key_name:
+            key_bit = self.key_bits.get(self._get_key_name(key))
+            if key_bit:
                 # Check current states before removing key
                 was_record_pressed = self.hotkey_states['record']
                 was_tts_pressed = self.hotkey_states['tts']
                 
-                self.pressed_keys.discard(key_name)
+                self.pressed_bits &= ~key_bit
                 
                 # Update hotkey states
                 self.hotkey_states['record'] = self._is_record_hotkey_pressed()
@@ -104,48 +150,69 @@ class HotkeyHandler:
                 
                 # If recording hotkey was pressed and now released, trigger callback
                 if was_record_pressed and not self.hotkey_states['record']:
-                    if self.on_release_callback:
-                        self.on_release_callback()
+                    self._schedule_release()
                         
-        except Exception as e:
-            logger.error(f"Error in key release handler: {e}")
+        except Exception:
+            logger.exception("Error in key release handler")
+    
+    def _schedule_release(self):
+        """Fire the release callback once the hotkey has stayed released."""
+        timer = threading.Timer(self.release_debounce_time, lambda: self._fire_release(timer))
+        timer.daemon = True
+        
+        with self.release_lock:
+            if self.release_timer:
+                self.release_timer.cancel()
+            self.release_timer = timer
+        timer.start()
+    
+    def _fire_release(self, timer: threading.Timer):
+        """Deliver a deferred release unless it was cancelled."""
+        # Held for the whole callback, so a re-press waits for the recording
+        # to finish stopping instead of restarting it mid-stop
+        with self.callback_lock:
+            with self.release_lock:
+                if self.release_timer is not timer:
+                    return
+                self.release_timer = None
+            
+            try:
+                if self.on_release_callback:
+                    self.on_release_callback()
+            except Exception:
+                logger.exception("Error in key release handler")
     
     def _get_key_name(self, key) -> Optional[str]:
         """Get normalized key name."""
-        try:
-            if hasattr(key, 'char') and key.char:
-                return key.char.lower()
-            elif hasattr(key, 'name'):
-                # Map special keys
-                key_name = key.name.lower()
-                if key_name == 'ctrl_l' or key_name == 'ctrl_r':
-                    return 'ctrl'
-                elif key_name == 'alt_l' or key_name == 'alt_r':
-                    return 'alt'
-                elif key_name == 'shift_l' or key_name == 'shift_r':
-                    return 'shift'
-                elif key_name == 'cmd_l' or key_name == 'cmd_r':
-                    return 'cmd'
-                else:
-                    return key_name
-            return None
-        except Exception:
-            return None
+        char = getattr(key, 'char', None)
+        if char:
+            return char.lower()
+        name = getattr(key, 'name', None)
+        # Map left/right modifier variants to a single name
+        return SPECIAL_KEY_NAMES.get(name, name) if name else None
+    
+    def _key_mask(self, keys: Tuple[str, ...]) -> int:
+        """Get the bitmask for a hotkey combination."""
+        mask = 0
+        for key_name in keys:
+            mask |= self.key_bits[key_name]
+        return mask
     
     def _is_record_hotkey_pressed(self) -> bool:
         """Check if the recording hotkey combination is currently pressed."""
-        hotkey_set = set(config.hotkey)
-        return hotkey_set.issubset(self.pressed_keys)
+        return (self.pressed_bits & self.record_mask) == self.record_mask
     
     def _is_tts_hotkey_pressed(self) -> bool:
         """Check if the TTS hotkey combination is currently pressed."""
-        hotkey_set = set(config.tts_hotkey)
-        return hotkey_set.issubset(self.pressed_keys)
+        return (self.pressed_bits & self.tts_mask) == self.tts_mask
     
     def get_status(self) -> dict:
         """Get current status of hotkey handler."""
         return {
             "is_listening": self.is_listening,
             "hotkey": config.hotkey,
-            "pressed_keys": list(self.pressed_keys)
+            "pressed_keys": [
+                key_name for key_name, key_bit in self.key_bits.items()
+                if self.pressed_bits & key_bit
+            ]
         } 
\ No newline at end of file
@@ -1,24 +1,105 @@
 """Main entry point for the Voice Transcriber application."""
 
 import argparse
+import atexit
 import logging
+import logging.handlers
+import queue
+import signal
 import sys
+import threading
 from .config import config
-from .service import VoiceTranscriberService
 
 
-def setup_logging(debug: bool = False):
-    """Setup logging configuration."""
+# Log records buffered before writing to the log file
+LOG_BUFFER_CAPACITY = 256
+# Seconds between forced flushes of buffered log records
+LOG_FLUSH_INTERVAL = 2.0
+
+
+class DeferredFlushFileHandler(logging.FileHandler):
+    """FileHandler that writes records without flushing after each one."""
+    
+    def emit(self, record: logging.LogRecord):
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+
+class BatchFlushMemoryHandler(logging.handlers.MemoryHandler):
+    """MemoryHandler that flushes its target once per batch of records."""
+    
+    def flush(self):
+        super().flush()
+        with self.lock:
+            if self.target:
+                self.target.flush()
+
+
+def _start_periodic_flush(handler: logging.Handler, interval: float) -> threading.Event:
+    """Flush a buffering handler every interval seconds until the returned event is set."""
+    stop_event = threading.Event()
+    
+    def flush_loop():
+        while not stop_event.wait(interval):
+            handler.flush()
+    
+    threading.Thread(target=flush_loop, name="log-flush", daemon=True).start()
+    return stop_event
+
+
+def _exit_on_sigterm(signum, frame):
+    """Exit normally on SIGTERM so atexit handlers flush the log."""
+    sys.exit(0)
+
+
+def setup_logging(debug: bool = False) -> logging.handlers.QueueListener:
+    """Setup logging configuration.
+    
+    Records are put on a queue and written to stdout and the log file by a
+    background listener thread, so logging from the hotkey and audio
+    threads never blocks on I/O.
+    """
     level = logging.DEBUG if debug else logging.INFO
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    
+    stream_handler = logging.StreamHandler(sys.stdout)
+    # Opened on the first record, so --help never touches the log file
+    file_handler = DeferredFlushFileHandler(
+        'voice_transcriber.log', mode='a', encoding='utf-8', delay=True
+    )
+    for handler in (stream_handler, file_handler):
+        handler.setFormatter(formatter)
+    
+    # Batch file writes into one flush; warnings, errors and shutdown
+    # flush immediately
+    buffered_file_handler = BatchFlushMemoryHandler(
+        capacity=LOG_BUFFER_CAPACITY,
+        flushLevel=logging.WARNING,
+        target=file_handler,
+        flushOnClose=True
+    )
+    flush_stop_event = _start_periodic_flush(buffered_file_handler, LOG_FLUSH_INTERVAL)
+    
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(
+        log_queue, stream_handler, buffered_file_handler, respect_handler_level=True
+    )
+    listener.start()
+    # Flush queued records on exit
+    atexit.register(listener.stop)
+    atexit.register(flush_stop_event.set)
+    # Python skips atexit on SIGTERM (systemctl stop), so exit cleanly instead
+    signal.signal(signal.SIGTERM, _exit_on_sigterm)
     
     logging.basicConfig(
         level=level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.StreamHandler(sys.stdout),
-            logging.FileHandler('voice_transcriber.log')
-        ]
+        handlers=[logging.handlers.QueueHandler(log_queue)]
     )
+    return listener
 
 
 def main():
@@ -27,10 +108,18 @@ def main():
     parser.add_argument('--debug', action='store_true', help='Enable debug logging')
     parser.add_argument('--model', default='base', choices=['tiny', 'base', 'small', 'medium', 'large'], 
                        help='Whisper model size (default: base)')
+    parser.add_argument('--backend', default='openai', choices=['openai', 'faster'],
+                       help='Whisper implementation; faster needs faster-whisper installed (default: openai)')
+    parser.add_argument('--vad', action='store_true',
+                       help='Skip silence with Silero VAD (downloads the model from GitHub on first use)')
+    parser.add_argument('--tts-cache', type=int, default=0, metavar='N',
+                       help='Cache audio of the last N spoken texts in ~/.cache/voice-copilot/tts (default: 0, off)')
     parser.add_argument('--hotkey', default='ctrl+f1', help='Hotkey combination (default: ctrl+f1)')
     parser.add_argument('--tts-hotkey', default='ctrl+f2', help='TTS hotkey combination (default: ctrl+f2)')
     parser.add_argument('--no-tray', action='store_true', help='Disable system tray icon')
     parser.add_argument('--no-notifications', action='store_true', help='Disable desktop notifications')
+    parser.add_argument('--no-paste', action='store_true',
+                       help='Type transcriptions instead of pasting with Ctrl+V (e.g. for terminals)')
     parser.add_argument('--save-recordings', action='store_true', help='Save recordings for debugging')
     parser.add_argument('--test-typing', action='store_true', help='Test typing functionality and exit')
     
@@ -39,8 +128,12 @@ def main():
     # Update config from arguments
     config.debug = args.debug
     config.model_name = args.model
+    config.whisper_backend = args.backend
+    config.use_vad = args.vad
+    config.tts_cache_max_files = max(args.tts_cache, 0)
     config.show_system_tray = not args.no_tray
     config.show_notifications = not args.no_notifications
+    config.use_clipboard_paste = not args.no_paste
     config.save_recordings = args.save_recordings
     
     # Parse hotkeys
@@ -54,7 +147,8 @@ def main():
     
     logger = logging.getLogger(__name__)
     logger.info("Starting Voice Transcriber")
-    logger.info(f"Configuration: model={config.model_name}, hotkey={'+'.join(config.hotkey)}, tts_hotkey={'+'.join(config.tts_hotkey)}")
+    logger.info("Configuration: model=%s, hotkey=%s, tts_hotkey=%s",
+                config.model_name, '+'.join(config.hotkey), '+'.join(config.tts_hotkey))
     
     # Test typing functionality if requested
     if args.test_typing:
@@ -69,6 +163,9 @@ def main():
             print("Typing test failed!")
             return 1
     
+    # Imported here so --help and --test-typing skip loading Whisper and the UI stack
+    from .service import VoiceTranscriberService
+    
     # Create and run service
     service = VoiceTranscriberService()
     
@@ -76,7 +173,7 @@ def main():
         service.run_forever()
         return 0
     except Exception as e:
-        logger.error(f"Service failed: {e}")
+        logger.error("Service failed: %s", e)
         return 1
 
 
@@ -1,17 +1,16 @@
 """Main service that orchestrates all voice transcription components."""
 
+import concurrent.futures
 import logging
 import threading
-import time
 from typing import Optional
-from plyer import notification
+import numpy as np
 
 from .config import config
 from .audio_recorder import AudioRecorder
 from .transcriber import Transcriber
 from .text_inserter import TextInserter
 from .hotkey_handler import HotkeyHandler
-from .system_tray import SystemTray
 from .text_to_speech import TextToSpeech
 
 
@@ -28,11 +27,30 @@ class VoiceTranscriberService:
         self.text_inserter = TextInserter()
         self.text_to_speech = TextToSpeech()
         self.hotkey_handler = HotkeyHandler()
-        self.system_tray = SystemTray() if config.show_system_tray else None
+        self.system_tray = None
+        if config.show_system_tray:
+            # Only load pystray and PIL when the tray is enabled
+            from .system_tray import SystemTray
+            self.system_tray = SystemTray()
+        
+        # Reused worker threads for transcription and TTS
+        self.executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="vt-worker"
+        )
+        # Notifications get their own thread so a slow DBus call can't hold
+        # up transcription or TTS
+        self.notification_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="vt-notify"
+        )
         
         # State
         self.is_running = False
         self.is_processing = False
+        self.stop_event = threading.Event()
+        
+        # Notifications become a no-op when disabled, so call sites need no guard
+        if not config.show_notifications:
+            self._show_notification = lambda title, message: None
         
     def start(self) -> bool:
         """Start the voice transcriber service."""
@@ -59,19 +77,19 @@ class VoiceTranscriberService:
                 return False
             
             self.is_running = True
+            self.stop_event.clear()
             
             # Show startup notification
-            if config.show_notifications:
-                self._show_notification(
-                    "Voice Transcriber Started",
-                    f"Press {'+'.join(config.hotkey)} to record, {'+'.join(config.tts_hotkey)} for TTS"
-                )
+            self._show_notification(
+                "Voice Transcriber Started",
+                f"Press {'+'.join(config.hotkey)} to record, {'+'.join(config.tts_hotkey)} for TTS"
+            )
             
             logger.info("Voice Transcriber Service started successfully")
             return True
             
         except Exception as e:
-            logger.error(f"Failed to start service: {e}")
+            logger.error("Failed to start service: %s", e)
             self.stop()
             return False
     
@@ -92,7 +110,11 @@ class VoiceTranscriberService:
         if self.audio_recorder.is_recording_active():
             self.audio_recorder.stop_recording()
         
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.notification_executor.shutdown(wait=False, cancel_futures=True)
+        
         self.is_running = False
+        self.stop_event.set()
         logger.info("Voice Transcriber Service stopped")
     
     def _on_hotkey_press(self):
@@ -109,13 +131,12 @@ class VoiceTranscriberService:
                     self.system_tray.set_recording(True)
                 
                 # Show notification
-                if config.show_notifications:
-                    self._show_notification("Recording", "Hold key and speak...")
+                self._show_notification("Recording", "Hold key and speak...")
             else:
                 logger.warning("Failed to start recording")
                 
         except Exception as e:
-            logger.error(f"Error on hotkey press: {e}")
+            logger.error("Error on hotkey press: %s", e)
     
     def _on_hotkey_release(self):
         """Handle hotkey release (stop recording and transcribe)."""
@@ -130,21 +151,16 @@ class VoiceTranscriberService:
                 self.system_tray.set_recording(False)
             
             # Stop recording
-            audio_file = self.audio_recorder.stop_recording()
+            audio = self.audio_recorder.stop_recording_array()
             
-            if audio_file:
+            if audio is not None:
                 # Process in background thread
-                processing_thread = threading.Thread(
-                    target=self._process_audio,
-                    args=(audio_file,),
-                    daemon=True
-                )
-                processing_thread.start()
+                self._submit(self._process_audio, audio)
             else:
                 logger.info("No audio to process")
                 
         except Exception as e:
-            logger.error(f"Error on hotkey release: {e}")
+            logger.error("Error on hotkey release: %s", e)
     
     def _on_tts_hotkey_press(self):
         """Handle TTS hotkey press (read selected text)."""
@@ -155,28 +171,31 @@ class VoiceTranscriberService:
             logger.info("TTS hotkey pressed - reading selected text")
             
             # Speak selected text in background thread
-            tts_thread = threading.Thread(
-                target=self._process_tts,
-                daemon=True
-            )
-            tts_thread.start()
+            self._submit(self._process_tts)
             
         except Exception as e:
-            logger.error(f"Error on TTS hotkey press: {e}")
+            logger.error("Error on TTS hotkey press: %s", e)
+    
+    def _submit(self, fn, *args, executor: Optional[concurrent.futures.Executor] = None):
+        """Run a task on the worker pool, logging any exception it raises."""
+        future = (executor or self.executor).submit(fn, *args)
+        future.add_done_callback(self._log_task_error)
+        return future
+    
+    def _log_task_error(self, future: concurrent.futures.Future):
+        """Log the exception of a failed worker task."""
+        if not future.cancelled() and future.exception():
+            logger.error("Background task failed: %s", future.exception())
     
     def _process_tts(self):
         """Process text-to-speech in background thread."""
-        try:
-            logger.info("Processing text-to-speech")
-            
-            # Speak selected text or stop current speech if none selected
-            self.text_to_speech.speak_selected_text()
-                    
-        except Exception as e:
-            logger.error(f"Error processing TTS: {e}")
+        logger.info("Processing text-to-speech")
+        
+        # Speak selected text or stop current speech if none selected
+        self.text_to_speech.speak_selected_text()
     
-    def _process_audio(self, audio_file: str):
-        """Process audio file in background thread."""
+    def _process_audio(self, audio: np.ndarray):
+        """Process recorded audio in background thread."""
         if self.is_processing:
             logger.warning("Already processing audio, skipping")
             return
@@ -187,47 +206,49 @@ class VoiceTranscriberService:
             logger.info("Processing audio for transcription")
             
             # Show processing notification
-            if config.show_notifications:
-                self._show_notification("Processing", "Transcribing audio...")
+            self._show_notification("Processing", "Transcribing audio...")
             
             # Transcribe audio
-            text = self.transcriber.transcribe(audio_file)
+            text = self.transcriber.transcribe_array(audio, config.sample_rate)
             
             if text:
-                logger.info(f"Transcription successful: '{text}'")
+                logger.info("Transcription successful: '%s'", text)
                 
                 # Insert text
                 if self.text_inserter.insert_text(text):
                     # Show success notification
+                    # Skip building the preview when notifications are off
                     if config.show_notifications:
                         self._show_notification("Success", f"Typed: {text[:50]}...")
                 else:
                     logger.error("Failed to insert text")
-                    if config.show_notifications:
-                        self._show_notification("Error", "Failed to insert text")
+                    self._show_notification("Error", "Failed to insert text")
             else:
                 logger.warning("No text transcribed")
-                if config.show_notifications:
-                    self._show_notification("No Speech", "No speech detected or transcription failed")
+                self._show_notification("No Speech", "No speech detected or transcription failed")
                     
         except Exception as e:
-            logger.error(f"Error processing audio: {e}")
-            if config.show_notifications:
-                self._show_notification("Error", "Processing failed")
+            logger.error("Error processing audio: %s", e)
+            self._show_notification("Error", "Processing failed")
         finally:
             self.is_processing = False
     
     def _show_notification(self, title: str, message: str):
-        """Show desktop notification."""
+        """Show desktop notification without blocking the caller."""
         try:
-            notification.notify(
-                title=title,
-                message=message,
-                app_name="Voice Transcriber",
-                timeout=3
-            )
+            self._submit(self._notify, title, message, executor=self.notification_executor)
         except Exception as e:
-            logger.error(f"Failed to show notification: {e}")
+            logger.error("Failed to show notification: %s", e)
+    
+    def _notify(self, title: str, message: str):
+        """Send desktop notification (blocks on DBus/toast delivery)."""
+        from plyer import notification
+        notification.notify(
+            title=title,
+            message=message,
+            app_name="Voice Transcriber",
+            timeout=3
+        )
     
     def get_status(self) -> dict:
         """Get service status."""
@@ -249,8 +270,8 @@ class VoiceTranscriberService:
         
         try:
             logger.info("Service running. Press Ctrl+C to stop.")
-            while self.is_running:
-                time.sleep(1)
+            # Sleep until stop() is called (e.g. from the tray menu)
+            self.stop_event.wait()
         except KeyboardInterrupt:
             logger.info("Received interrupt signal")
         finally:
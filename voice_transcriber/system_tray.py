@@ -2,6 +2,8 @@
 
 import logging
 import threading
+import time
+from functools import lru_cache
 from typing import Callable, Optional
 from PIL import Image, ImageDraw
 import pystray
@@ -12,6 +14,64 @@ from .config import config
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _build_icon(color: str, recording: bool) -> Image.Image:
+    """Draw the tray icon; cached since pystray only reads the image."""
+    # Create a simple icon
+    size = 64
+    image = Image.new('RGBA', (size, size), (255, 255, 255, 0))
+    draw = ImageDraw.Draw(image)
+    
+    # Draw microphone shape
+    mic_color = color
+    
+    # Microphone body (rectangle with rounded top)
+    body_width = size // 3
+    body_height = size // 2
+    body_x = (size - body_width) // 2
+    body_y = size // 4
+    
+    draw.rounded_rectangle([
+        body_x, body_y,
+        body_x + body_width, body_y + body_height
+    ], radius=body_width//4, fill=mic_color)
+    
+    # Microphone stand
+    stand_width = 4
+    stand_height = size // 6
+    stand_x = (size - stand_width) // 2
+    stand_y = body_y + body_height
+    
+    draw.rectangle([
+        stand_x, stand_y,
+        stand_x + stand_width, stand_y + stand_height
+    ], fill=mic_color)
+    
+    # Base
+    base_width = size // 2
+    base_height = 4
+    base_x = (size - base_width) // 2
+    base_y = stand_y + stand_height
+    
+    draw.rectangle([
+        base_x, base_y,
+        base_x + base_width, base_y + base_height
+    ], fill=mic_color)
+    
+    # Recording indicator (circle)
+    if recording:
+        indicator_size = 8
+        indicator_x = body_x + body_width - indicator_size // 2
+        indicator_y = body_y - indicator_size // 2
+        
+        draw.ellipse([
+            indicator_x, indicator_y,
+            indicator_x + indicator_size, indicator_y + indicator_size
+        ], fill='red')
+    
+    return image
+
+
 class SystemTray:
     """System tray integration for recording status."""
     
@@ -22,6 +82,19 @@ class SystemTray:
         self.tray_thread: Optional[threading.Thread] = None
         self.on_quit_callback: Optional[Callable] = None
         
+        # Icons and menus for each state, built once in start()
+        self.idle_image: Optional[Image.Image] = None
+        self.recording_image: Optional[Image.Image] = None
+        self.idle_menu: Optional[Menu] = None
+        self.recording_menu: Optional[Menu] = None
+        
+        # State currently shown, and debouncing of rapid toggles
+        self.shown_recording = False
+        self.last_update = 0.0
+        self.update_debounce_time = 0.05  # 50ms debounce
+        self.update_timer: Optional[threading.Timer] = None
+        self.update_lock = threading.Lock()
+        
     def start(self, on_quit: Optional[Callable] = None) -> bool:
         """Start system tray icon."""
         if self.is_running:
@@ -31,23 +104,19 @@ class SystemTray:
         
         try:
             # Create icons
-            idle_icon = self._create_icon(color='gray', recording=False)
-            recording_icon = self._create_icon(color='red', recording=True)
+            self.idle_image = self._create_icon(color='gray', recording=False)
+            self.recording_image = self._create_icon(color='red', recording=True)
             
-            # Create menu
-            menu = Menu(
-                MenuItem("Voice Transcriber", None, enabled=False),
-                MenuItem("Status: Idle", None, enabled=False),
-                Menu.SEPARATOR,
-                MenuItem("Quit", self._quit_handler)
-            )
+            # Create menus
+            self.idle_menu = self._create_menu("Status: Idle")
+            self.recording_menu = self._create_menu("Status: Recording...")
             
             # Create tray icon
             self.icon = pystray.Icon(
                 "voice-transcriber",
-                idle_icon,
+                self.idle_image,
                 "Voice Transcriber",
-                menu
+                self.idle_menu
             )
             
             # Start in separate thread
@@ -64,6 +133,11 @@ class SystemTray:
     
     def stop(self):
         """Stop system tray icon."""
+        with self.update_lock:
+            if self.update_timer:
+                self.update_timer.cancel()
+                self.update_timer = None
+        
         if self.icon:
             self.icon.stop()
             
@@ -74,88 +148,59 @@ class SystemTray:
         """Update recording status in system tray."""
         if not self.icon or not self.is_running:
             return
+        
+        with self.update_lock:
+            if recording == self.is_recording:
+                return
+            self.is_recording = recording
             
-        self.is_recording = recording
+            # Coalesce rapid toggles into one update at the end of the window
+            since_update = time.monotonic() - self.last_update
+            if since_update < self.update_debounce_time:
+                if self.update_timer:
+                    self.update_timer.cancel()
+                self.update_timer = threading.Timer(
+                    self.update_debounce_time - since_update, self._apply_recording_state
+                )
+                self.update_timer.daemon = True
+                self.update_timer.start()
+                return
+        
+        self._apply_recording_state()
+    
+    def _apply_recording_state(self):
+        """Show the current recording state if it isn't already shown."""
+        with self.update_lock:
+            self.update_timer = None
+            recording = self.is_recording
+            if recording == self.shown_recording:
+                return
+            self.shown_recording = recording
+            self.last_update = time.monotonic()
         
         try:
             if recording:
-                icon = self._create_icon(color='red', recording=True)
-                menu = Menu(
-                    MenuItem("Voice Transcriber", None, enabled=False),
-                    MenuItem("Status: Recording...", None, enabled=False),
-                    Menu.SEPARATOR,
-                    MenuItem("Quit", self._quit_handler)
-                )
+                self.icon.icon = self.recording_image
+                self.icon.menu = self.recording_menu
             else:
-                icon = self._create_icon(color='gray', recording=False)
-                menu = Menu(
-                    MenuItem("Voice Transcriber", None, enabled=False),
-                    MenuItem("Status: Idle", None, enabled=False),
-                    Menu.SEPARATOR,
-                    MenuItem("Quit", self._quit_handler)
-                )
-            
-            self.icon.icon = icon
-            self.icon.menu = menu
+                self.icon.icon = self.idle_image
+                self.icon.menu = self.idle_menu
             
         except Exception as e:
             logger.error(f"Failed to update system tray: {e}")
     
+    def _create_menu(self, status: str) -> Menu:
+        """Create system tray menu showing the given status."""
+        return Menu(
+            MenuItem("Voice Transcriber", None, enabled=False),
+            MenuItem(status, None, enabled=False),
+            Menu.SEPARATOR,
+            MenuItem("Quit", self._quit_handler)
+        )
+    
     def _create_icon(self, color: str = 'gray', recording: bool = False) -> Image.Image:
         """Create system tray icon."""
-        # Create a simple icon
-        size = 64
-        image = Image.new('RGBA', (size, size), (255, 255, 255, 0))
-        draw = ImageDraw.Draw(image)
-        
-        # Draw microphone shape
-        mic_color = color
-        
-        # Microphone body (rectangle with rounded top)
-        body_width = size // 3
-        body_height = size // 2
-        body_x = (size - body_width) // 2
-        body_y = size // 4
-        
-        draw.rounded_rectangle([
-            body_x, body_y,
-            body_x + body_width, body_y + body_height
-        ], radius=body_width//4, fill=mic_color)
-        
-        # Microphone stand
-        stand_width = 4
-        stand_height = size // 6
-        stand_x = (size - stand_width) // 2
-        stand_y = body_y + body_height
-        
-        draw.rectangle([
-            stand_x, stand_y,
-            stand_x + stand_width, stand_y + stand_height
-        ], fill=mic_color)
-        
-        # Base
-        base_width = size // 2
-        base_height = 4
-        base_x = (size - base_width) // 2
-        base_y = stand_y + stand_height
-        
-        draw.rectangle([
-            base_x, base_y,
-            base_x + base_width, base_y + base_height
-        ], fill=mic_color)
-        
-        # Recording indicator (circle)
-        if recording:
-            indicator_size = 8
-            indicator_x = body_x + body_width - indicator_size // 2
-            indicator_y = body_y - indicator_size // 2
-            
-            draw.ellipse([
-                indicator_x, indicator_y,
-                indicator_x + indicator_size, indicator_y + indicator_size
-            ], fill='red')
-        
-        return image
+        return _build_icon(color, recording)
     
     def _run_tray(self):
         """Run system tray in separate thread."""
@@ -1,21 +1,30 @@
 """Text insertion functionality to type transcribed text at cursor."""
 
 import logging
+import re
 import time
 from typing import Optional
 import pyautogui
+import pyperclip
 from .config import config
 
 
 logger = logging.getLogger(__name__)
 
+MULTIPLE_SPACES = re.compile(r" {2,}")
+SPACE_BEFORE_PUNCTUATION = re.compile(r" ([.,!?:;])")
+
 
 class TextInserter:
-    """Handles typing transcribed text at cursor position."""
+    """Handles typing transcribed text at cursor position.
+    
+    pyautogui's global PAUSE is disabled; the delay between typed
+    characters is set by config.type_interval instead.
+    """
     
     def __init__(self):
         # Configure pyautogui
-        pyautogui.PAUSE = 0.01  # Small pause between actions
+        pyautogui.PAUSE = 0  # No implicit sleep after every action
         pyautogui.FAILSAFE = True  # Move mouse to corner to abort
     
     def insert_text(self, text: str) -> bool:
@@ -32,20 +41,47 @@ class TextInserter:
                 logger.warning("No text remaining after cleaning")
                 return False
             
-            logger.info(f"Inserting text: '{cleaned_text}'")
+            logger.info("Inserting text: '%s'", cleaned_text)
             
             # Small delay to ensure focus is ready
             time.sleep(0.1)
             
-            # Type the text
-            pyautogui.typewrite(cleaned_text, interval=0.01)
+            # Paste the text in one action; type it if the clipboard fails
+            if not (config.use_clipboard_paste and self._paste_text(cleaned_text)):
+                pyautogui.typewrite(cleaned_text, interval=config.type_interval)
             
             logger.info("Text insertion completed")
             return True
             
         except Exception as e:
-            logger.error(f"Failed to insert text: {e}")
+            logger.error("Failed to insert text: %s", e)
+            return False
+    
+    def _paste_text(self, text: str) -> bool:
+        """Insert text via the clipboard, restoring its previous content."""
+        try:
+            previous_clipboard = pyperclip.paste()
+        except Exception as e:
+            logger.warning("Could not read clipboard, typing instead: %s", e)
             return False
+        
+        try:
+            pyperclip.copy(text)
+            pyautogui.hotkey('ctrl', 'v')
+            
+            # Give the target application time to read the clipboard
+            time.sleep(0.1)
+            return True
+            
+        except Exception as e:
+            logger.warning("Clipboard paste failed, typing instead: %s", e)
+            return False
+            
+        finally:
+            try:
+                pyperclip.copy(previous_clipboard)
+            except Exception as e:
+                logger.warning("Failed to restore clipboard: %s", e)
     
     def _clean_text(self, text: str) -> str:
         """Clean and format text for insertion."""
@@ -53,16 +89,10 @@ class TextInserter:
         cleaned = text.strip()
         
         # Remove multiple spaces
-        while "  " in cleaned:
-            cleaned = cleaned.replace("  ", " ")
+        cleaned = MULTIPLE_SPACES.sub(" ", cleaned)
         
         # Handle common punctuation spacing
-        cleaned = cleaned.replace(" .", ".")
-        cleaned = cleaned.replace(" ,", ",")
-        cleaned = cleaned.replace(" !", "!")
-        cleaned = cleaned.replace(" ?", "?")
-        cleaned = cleaned.replace(" :", ":")
-        cleaned = cleaned.replace(" ;", ";")
+        cleaned = SPACE_BEFORE_PUNCTUATION.sub(r"\1", cleaned)
         
         # Capitalize first letter if it's a sentence
         if cleaned and cleaned[0].islower():
@@ -78,5 +108,5 @@ class TextInserter:
             pyautogui.typewrite(test_text)
             return True
         except Exception as e:
-            logger.error(f"Typing test failed: {e}")
+            logger.error("Typing test failed: %s", e)
             return False 
\ No newline at end of file
@@ -2,20 +2,94 @@
 
 import logging
 import asyncio
-import tempfile
+import hashlib
+import io
 import os
+import re
+import select
 import threading
 import time
-from typing import Optional
+from typing import Callable, List, Optional
 import pyperclip
 import edge_tts
 import pygame
 import pyautogui
 import signal
 
+from .config import config
 
 logger = logging.getLogger(__name__)
 
+# Common symbols and their spoken equivalents
+SYMBOL_REPLACEMENTS = {
+    "&": "and",
+    "@": "at",
+    "#": "hash",
+    "$": "dollar",
+    "%": "percent",
+    "^": "caret",
+    "*": "asterisk",
+    "+": "plus",
+    "=": "equals",
+    "<": "less than",
+    ">": "greater than",
+    "|": "pipe",
+    "\\": "backslash",
+    "/": "slash",
+    "~": "tilde",
+    "`": "backtick",
+    "©": "copyright",
+    "®": "registered",
+    "™": "trademark",
+    "°": "degrees",
+    "€": "euro",
+    "£": "pound",
+    "¥": "yen",
+    "₹": "rupee",
+    "—": " ",
+    "–": " ",
+    "…": " dot dot dot ",
+    "→": "arrow",
+    "←": "left arrow",
+    "↑": "up arrow",
+    "↓": "down arrow",
+    "✓": "checkmark",
+    "✗": "x mark",
+    "★": "star",
+    "♥": "heart",
+    "♦": "diamond",
+    "♣": "club",
+    "♠": "spade"
+}
+
+# Single characters are mapped in one C-level pass with str.translate;
+# any multi-character symbols go through a regex first, longest first
+SYMBOL_TABLE = str.maketrans(
+    {symbol: spoken for symbol, spoken in SYMBOL_REPLACEMENTS.items() if len(symbol) == 1}
+)
+MULTI_CHAR_SYMBOLS = sorted((symbol for symbol in SYMBOL_REPLACEMENTS if len(symbol) > 1), key=len, reverse=True)
+MULTI_CHAR_SYMBOL_PATTERN = (
+    re.compile("|".join(re.escape(symbol) for symbol in MULTI_CHAR_SYMBOLS))
+    if MULTI_CHAR_SYMBOLS else None
+)
+URL_PREFIX_PATTERN = re.compile(r"https?://|www\.")
+EMAIL_WORD_PATTERN = re.compile(r"\S*@\S*")
+MARKDOWN_PATTERN = re.compile(r"\*\*|__|```|##|[*_`#]")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+# Text longer than this is split at sentence boundaries so the first
+# sentence can play while the rest are synthesized
+SENTENCE_CHUNK_THRESHOLD = 100
+SENTENCE_BOUNDARY_PATTERN = re.compile(r"(?<=[.!?])\s+")
+MAX_CONCURRENT_SYNTHESIS = 2
+
+# How often playback checks whether the track has ended (seconds); a
+# stop request wakes the wait immediately regardless
+PLAYBACK_POLL_INTERVAL = 0.05
+# Tighter check while another sentence is waiting, to keep the gap
+# between sentences short
+CHUNK_POLL_INTERVAL = 0.01
+
 
 class TextToSpeech:
     """Handles text-to-speech functionality."""
@@ -25,16 +99,28 @@ class TextToSpeech:
         self.current_speech_task = None
         self.speech_thread = None
         self.is_speaking = False
-        self.stop_requested = False
+        self.stop_event = threading.Event()
         
         try:
-            # Initialize pygame mixer for audio playback
-            pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=1024)
+            # Initialize pygame mixer for audio playback, matching Edge-TTS's
+            # 24 kHz mono output so SDL doesn't resample; 512 frames is ~21ms
+            pygame.mixer.init(frequency=24000, size=-16, channels=1, buffer=512)
             logger.info("Pygame mixer initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize pygame mixer: {e}")
             raise
         
+        # Event loop reused for every Edge-TTS request
+        self.loop = asyncio.new_event_loop()
+        self.loop_thread = threading.Thread(target=self.loop.run_forever, name="tts-loop", daemon=True)
+        self.loop_thread.start()
+        
+        # X11 connection for reading the selection, opened on first use
+        self.x_display = None
+        self.x_window = None
+        self.x_clipboard_watched = False
+        self.x_lock = threading.Lock()
+        
         # Default voice (can be customized)
         self.voice = "en-US-AriaNeural"  # High-quality female voice
         
@@ -46,75 +132,43 @@ class TextToSpeech:
             return ""
         
         # Remove excessive whitespace
-        text = " ".join(text.split())
+        text = WHITESPACE_PATTERN.sub(" ", text).strip()
         
         # Replace common symbols with spoken equivalents
-        replacements = {
-            "&": "and",
-            "@": "at",
-            "#": "hash",
-            "$": "dollar",
-            "%": "percent",
-            "^": "caret",
-            "*": "asterisk",
-            "+": "plus",
-            "=": "equals",
-            "<": "less than",
-            ">": "greater than",
-            "|": "pipe",
-            "\\": "backslash",
-            "/": "slash",
-            "~": "tilde",
-            "`": "backtick",
-            "©": "copyright",
-            "®": "registered",
-            "™": "trademark",
-            "°": "degrees",
-            "€": "euro",
-            "£": "pound",
-            "¥": "yen",
-            "₹": "rupee",
-            "—": " ",
-            "–": " ",
-            "…": " dot dot dot ",
-            "→": "arrow",
-            "←": "left arrow",
-            "↑": "up arrow",
-            "↓": "down arrow",
-            "✓": "checkmark",
-            "✗": "x mark",
-            "★": "star",
-            "♥": "heart",
-            "♦": "diamond",
-            "♣": "club",
-            "♠": "spade"
-        }
+        spoken = text
+        if MULTI_CHAR_SYMBOL_PATTERN is not None:
+            spoken = MULTI_CHAR_SYMBOL_PATTERN.sub(lambda match: SYMBOL_REPLACEMENTS[match.group(0)], spoken)
+        spoken = spoken.translate(SYMBOL_TABLE)
         
-        for symbol, replacement in replacements.items():
-            text = text.replace(symbol, replacement)
+        # Plain prose has nothing for the remaining steps to change
+        if spoken == text and "_" not in text and "http" not in text.lower():
+            return text
+        text = spoken
         
         # Handle URLs
         if "http" in text.lower():
-            text = text.replace("https://", "").replace("http://", "")
-            text = text.replace("www.", "")
+            text = URL_PREFIX_PATTERN.sub("", text)
         
         # Handle email addresses
         if "@" in text and "." in text:
-            words = text.split()
-            for i, word in enumerate(words):
-                if "@" in word and "." in word:
-                    words[i] = word.replace("@", " at ").replace(".", " dot ")
-            text = " ".join(words)
+            text = EMAIL_WORD_PATTERN.sub(self._speak_email, text)
         
         # Remove markdown formatting
-        text = text.replace("**", "").replace("*", "").replace("__", "").replace("_", "")
-        text = text.replace("```", "").replace("`", "").replace("##", "").replace("#", "")
+        text = MARKDOWN_PATTERN.sub("", text)
         
         # Clean up multiple spaces
-        text = " ".join(text.split())
+        text = WHITESPACE_PATTERN.sub(" ", text)
         
         return text.strip()
     
+    @staticmethod
+    def _speak_email(match: re.Match) -> str:
+        """Spell out the separators of an email-like word."""
+        word = match.group(0)
+        if "." not in word:
+            return word
+        return word.replace("@", " at ").replace(".", " dot ")
+    
     def get_selected_text(self) -> Optional[str]:
         """Get selected text from clipboard by simulating Ctrl+C"""
         try:
@@ -131,20 +185,22 @@ class TextToSpeech:
             
             # Try different approaches to get selected text
             
-            # METHOD 1: Try using xclip to get selection directly (Linux-specific)
+            # METHOD 1: Read the primary selection directly (Linux-specific)
             try:
-                import subprocess
-                logger.info("Trying Method 1: xclip selection")
-                result = subprocess.run(['xclip', '-selection', 'primary', '-o'], 
-                                      capture_output=True, text=True, timeout=2)
-                if result.returncode == 0 and result.stdout.strip():
-                    selected_text = result.stdout.strip()
-                    logger.info(f"✓ SUCCESS (xclip): Got selected text: '{selected_text[:50]}...'")
+                logger.info("Trying Method 1: X11 primary selection")
+                try:
+                    selected_text = self._read_primary_selection()
+                except Exception as e:
+                    logger.info(f"Direct X11 selection read unavailable, using xclip: {e}")
+                    selected_text = self._read_primary_selection_xclip()
+                
+                if selected_text:
+                    logger.info(f"✓ SUCCESS (primary selection): Got selected text: '{selected_text[:50]}...'")
                     return selected_text
                 else:
-                    logger.info("xclip returned empty or failed")
+                    logger.info("Primary selection empty or unavailable")
             except Exception as e:
-                logger.info(f"xclip method failed: {e}")
+                logger.info(f"Primary selection method failed: {e}")
             
             # METHOD 2: Traditional clipboard copy with better timing
             logger.info("Trying Method 2: Traditional clipboard copy")
@@ -165,15 +221,14 @@ class TextToSpeech:
                     logger.info(f"Copy attempt {attempt + 1}/3")
                     
                     try:
-                        # Use keyDown/keyUp for more control
-                        pyautogui.keyDown('ctrl')
-                        time.sleep(0.05)
-                        pyautogui.press('c')
-                        time.sleep(0.05)
-                        pyautogui.keyUp('ctrl')
-                        
-                        # Wait and check if something was copied
-                        time.sleep(0.3)
+                        # Wait only until the application takes the clipboard,
+                        # or a fixed delay when X11 can't notify us
+                        try:
+                            self._copy_and_wait_for_clipboard(timeout=0.3)
+                        except Exception as e:
+                            logger.debug(f"Clipboard change notification unavailable: {e}")
+                            self._send_copy_shortcut()
+                            time.sleep(0.3)
                         
                         current_clipboard = pyperclip.paste()
                         logger.info(f"Attempt {attempt + 1} result: '{current_clipboard}'")
@@ -191,13 +246,12 @@ class TextToSpeech:
             except Exception as e:
                 logger.error(f"Traditional copy method failed: {e}")
             
-            # Restore original clipboard
+            # Restore original clipboard in the background; pyperclip forks
+            # xclip/xsel and nothing here needs to wait for it
             if original_clipboard:
-                try:
-                    pyperclip.copy(original_clipboard)
-                    logger.info("Original clipboard restored")
-                except:
-                    pass
+                threading.Thread(
+                    target=self._restore_clipboard, args=(original_clipboard,), name="clipboard-restore", daemon=True
+                ).start()
             
             return None
             
@@ -207,49 +261,251 @@ class TextToSpeech:
         finally:
             logger.info("=== ENDING get_selected_text ===\n")
     
-    async def _generate_speech(self, text: str) -> Optional[str]:
-        """Generate speech audio file using Edge-TTS"""
+    def _restore_clipboard(self, text: str):
+        """Put the user's previous clipboard content back."""
+        try:
+            pyperclip.copy(text)
+            logger.info("Original clipboard restored")
+        except:
+            pass
+    
+    def _send_copy_shortcut(self):
+        """Send Ctrl+C to the focused window."""
+        # Use keyDown/keyUp for more control
+        pyautogui.keyDown('ctrl')
+        time.sleep(0.05)
+        pyautogui.press('c')
+        time.sleep(0.05)
+        pyautogui.keyUp('ctrl')
+    
+    def _get_x_display(self):
+        """Open the X11 connection and helper window on first use.
+        
+        Must be called with x_lock held.
+        """
+        # Import here so setups without python-xlib fall back to xclip
+        from Xlib import X, display
+        
+        if self.x_display is None:
+            self.x_display = display.Display()
+            self.x_window = self.x_display.screen().root.create_window(
+                0, 0, 1, 1, 0, X.CopyFromParent
+            )
+        return self.x_display
+    
+    def _wait_for_x_event(self, matches: Callable, timeout: float):
+        """Return the first X11 event accepted by matches, or None on timeout.
+        
+        Must be called with x_lock held.
+        """
+        disp = self.x_display
+        deadline = time.monotonic() + timeout
+        while True:
+            if not disp.pending_events():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                select.select([disp], [], [], remaining)
+                continue
+            event = disp.next_event()
+            if matches(event):
+                return event
+    
+    def _copy_and_wait_for_clipboard(self, timeout: float) -> bool:
+        """Send Ctrl+C and block until an application takes the clipboard.
+        
+        Uses XFixes selection-owner notifications; raises if they are
+        unavailable. Returns False if no owner change arrived in time.
+        """
+        from Xlib.ext import xfixes
+        
+        with self.x_lock:
+            disp = self._get_x_display()
+            if not self.x_clipboard_watched:
+                if not disp.has_extension('XFIXES'):
+                    raise RuntimeError("XFIXES extension not available")
+                disp.xfixes_query_version()
+                disp.xfixes_select_selection_input(
+                    self.x_window, disp.intern_atom('CLIPBOARD'),
+                    xfixes.XFixesSetSelectionOwnerNotifyMask
+                )
+                disp.sync()
+                self.x_clipboard_watched = True
+            
+            # Discard notifications left over from earlier copies
+            while disp.pending_events():
+                disp.next_event()
+            
+            self._send_copy_shortcut()
+            
+            owner_changed = disp.extension_event.SetSelectionOwnerNotify
+            event = self._wait_for_x_event(
+                lambda e: (e.type, getattr(e, 'sub_code', None)) == owner_changed,
+                timeout
+            )
+            return event is not None
+    
+    def _read_primary_selection(self, timeout: float = 0.5) -> Optional[str]:
+        """Read the X11 PRIMARY selection in-process with python-xlib.
+        
+        Raises if Xlib or an X display is unavailable; returns None when
+        nothing is selected.
+        """
+        from Xlib import X, Xatom
+        
+        with self.x_lock:
+            disp = self._get_x_display()
+            
+            if disp.get_selection_owner(Xatom.PRIMARY) == X.NONE:
+                return None
+            
+            # Ask the selection owner to store the text on our window
+            target = disp.intern_atom('UTF8_STRING')
+            prop = disp.intern_atom('VOICE_TRANSCRIBER_SELECTION')
+            self.x_window.convert_selection(Xatom.PRIMARY, target, prop, X.CurrentTime)
+            disp.flush()
+            
+            event = self._wait_for_x_event(
+                lambda e: e.type == X.SelectionNotify and e.selection == Xatom.PRIMARY,
+                timeout
+            )
+            if event is None:
+                logger.info("Timed out waiting for primary selection")
+                return None
+            
+            if event.property == X.NONE:
+                return None
+            
+            reply = self.x_window.get_full_property(prop, X.AnyPropertyType)
+            self.x_window.delete_property(prop)
+            
+            if reply is None:
+                return None
+            
+            # Very large selections arrive incrementally (INCR); leave those to xclip
+            if reply.property_type == disp.intern_atom('INCR'):
+                return self._read_primary_selection_xclip()
+            
+            value = reply.value
+            if isinstance(value, bytes):
+                value = value.decode('utf-8', errors='replace')
+            return value.strip() or None
+    
+    def _read_primary_selection_xclip(self) -> Optional[str]:
+        """Read the X11 PRIMARY selection by running xclip."""
+        import subprocess
+        result = subprocess.run(['xclip', '-selection', 'primary', '-o'], 
+                              capture_output=True, text=True, timeout=2)
+        if result.returncode == 0 and result.stdout.strip():
+            return result.stdout.strip()
+        return None
+    
+    async def _generate_speech(self, text: str) -> Optional[bytes]:
+        """Generate speech audio in memory using Edge-TTS"""
         try:
             logger.debug(f"Generating speech for text: '{text[:50]}...'")
             
             # Import here to handle potential import errors
             import edge_tts
             
-            # Create temporary file for audio
-            with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as temp_file:
-                temp_path = temp_file.name
-            
-            logger.debug(f"Generating audio to: {temp_path}")
-            
-            # Generate speech
+            # Collect the streamed MP3 chunks in memory
+            audio_buffer = io.BytesIO()
             communicate = edge_tts.Communicate(text, self.voice)
-            await communicate.save(temp_path)
+            async for chunk in communicate.stream():
+                if chunk["type"] == "audio":
+                    audio_buffer.write(chunk["data"])
             
-            file_size = os.path.getsize(temp_path)
-            logger.info(f"Generated audio file: {file_size} bytes")
+            audio_data = audio_buffer.getvalue()
+            logger.info(f"Generated audio: {len(audio_data)} bytes")
             
-            return temp_path
+            return audio_data if audio_data else None
             
         except Exception as e:
             logger.error(f"Error generating speech: {e}")
             return None
     
-    def _play_audio(self, audio_path: str):
-        """Play audio file using pygame"""
+    def _split_sentences(self, text: str) -> List[str]:
+        """Split text into sentences for pipelined synthesis."""
+        if len(text) <= SENTENCE_CHUNK_THRESHOLD:
+            return [text]
+        
+        return [sentence for sentence in SENTENCE_BOUNDARY_PATTERN.split(text) if sentence.strip()]
+    
+    async def _get_speech(self, text: str, semaphore: asyncio.Semaphore) -> Optional[bytes]:
+        """Get audio for one chunk from the cache or Edge-TTS."""
+        # Repeated snippets are served from the on-disk cache
+        cache_path = self._cache_path(text) if config.tts_cache_max_files > 0 else None
+        # File I/O runs off the event loop so it can't stall other chunks' streams
+        audio_data = await asyncio.to_thread(self._read_cached_speech, cache_path) if cache_path else None
+        if audio_data:
+            logger.debug("Using cached speech audio")
+            return audio_data
+        
+        # Limit parallel requests to avoid Edge-TTS throttling, and give each
+        # one a reasonable timeout (30 seconds)
+        async with semaphore:
+            audio_data = await asyncio.wait_for(self._generate_speech(text), timeout=30.0)
+        
+        if audio_data and cache_path:
+            await asyncio.to_thread(self._write_cached_speech, cache_path, audio_data)
+        
+        return audio_data
+    
+    def _cache_path(self, text: str) -> str:
+        """Get the audio cache file for this voice and text."""
+        key = hashlib.blake2b(f"{self.voice}|{text}".encode("utf-8"), digest_size=8).hexdigest()
+        return os.path.join(config.tts_cache_dir, f"{key}.mp3")
+    
+    def _read_cached_speech(self, path: str) -> Optional[bytes]:
+        """Load previously generated audio, refreshing its mtime for eviction."""
+        try:
+            with open(path, "rb") as f:
+                audio_data = f.read()
+            os.utime(path)
+            return audio_data if audio_data else None
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Failed to read cached speech {path}: {e}")
+            return None
+    
+    def _write_cached_speech(self, path: str, audio_data: bytes):
+        """Store generated audio and evict the least recently used files."""
+        try:
+            os.makedirs(config.tts_cache_dir, exist_ok=True)
+            
+            # Write under a temporary name so readers never see a partial file
+            temp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(temp_path, "wb") as f:
+                f.write(audio_data)
+            os.replace(temp_path, path)
+            
+            entries = [entry for entry in os.scandir(config.tts_cache_dir) if entry.name.endswith(".mp3")]
+            if len(entries) > config.tts_cache_max_files:
+                entries.sort(key=lambda entry: entry.stat().st_mtime)
+                for entry in entries[:len(entries) - config.tts_cache_max_files]:
+                    os.unlink(entry.path)
+                    
+        except Exception as e:
+            logger.warning(f"Failed to cache speech {path}: {e}")
+    
+    def _play_audio(self, audio_data: bytes, poll_interval: float = PLAYBACK_POLL_INTERVAL):
+        """Play MP3 audio from memory using pygame"""
         try:
-            logger.debug(f"Playing audio file: {audio_path}")
+            logger.debug(f"Playing {len(audio_data)} bytes of audio")
             
             import pygame
-            pygame.mixer.music.load(audio_path)
+            pygame.mixer.music.load(io.BytesIO(audio_data), "mp3")
             pygame.mixer.music.play()
             
             logger.info("Audio playback started")
             
             # Wait for playback to complete or stop to be requested
-            while pygame.mixer.music.get_busy() and not self.stop_requested:
-                time.sleep(0.1)
+            while pygame.mixer.music.get_busy():
+                if self.stop_event.wait(poll_interval):
+                    break
                 
-            if self.stop_requested:
+            if self.stop_event.is_set():
                 logger.info("Audio playback stopped by request")
             else:
                 logger.info("Audio playback completed")
@@ -263,11 +519,7 @@ class TextToSpeech:
                 if pygame.mixer.music.get_busy():
                     pygame.mixer.music.stop()
                     logger.debug("Stopped pygame mixer")
-            except:
-                pass
-            try:
-                os.unlink(audio_path)
-                logger.debug(f"Cleaned up audio file: {audio_path}")
+                pygame.mixer.music.unload()
             except:
                 pass
     
@@ -275,38 +527,47 @@ class TextToSpeech:
         """Background worker for speech synthesis and playback"""
         try:
             self.is_speaking = True
-            self.stop_requested = False
+            self.stop_event.clear()
             
             logger.debug("Starting speech worker thread")
             
-            # Run async speech generation with timeout
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+            # Synthesize upcoming sentences while earlier ones play, so the
+            # first audio only waits for the first sentence
+            chunks = self._split_sentences(text)
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_SYNTHESIS)
+            futures = [
+                asyncio.run_coroutine_threadsafe(self._get_speech(chunk, semaphore), self.loop)
+                for chunk in chunks
+            ]
             
             try:
-                # Set a reasonable timeout for speech generation (30 seconds)
-                audio_path = loop.run_until_complete(
-                    asyncio.wait_for(self._generate_speech(text), timeout=30.0)
-                )
-                
-                if audio_path and not self.stop_requested:
-                    logger.debug("Speech generated successfully, starting playback")
-                    self._play_audio(audio_path)
-                else:
-                    logger.warning("Speech generation failed or was cancelled")
+                for index, future in enumerate(futures):
+                    audio_data = future.result()
+                    
+                    if self.stop_event.is_set():
+                        break
+                    
+                    if audio_data:
+                        logger.debug(f"Playing chunk {index + 1}/{len(chunks)}")
+                        has_next = index + 1 < len(futures)
+                        self._play_audio(audio_data, CHUNK_POLL_INTERVAL if has_next else PLAYBACK_POLL_INTERVAL)
+                    else:
+                        logger.warning("Speech generation failed or was cancelled")
                     
             except asyncio.TimeoutError:
                 logger.error("Speech generation timed out after 30 seconds")
             except Exception as e:
                 logger.error(f"Error in speech generation: {e}")
             finally:
-                loop.close()
+                # Drop synthesis of chunks that will no longer be played
+                for future in futures:
+                    future.cancel()
                 
         except Exception as e:
             logger.error(f"Error in speech worker: {e}")
         finally:
             self.is_speaking = False
-            self.stop_requested = False
+            self.stop_event.clear()
             logger.debug("Speech worker thread finished")
     
     def speak_text(self, text: str):
@@ -341,23 +602,19 @@ class TextToSpeech:
         try:
             logger.info("TTS hotkey triggered - checking for selected text")
             
+            # The hotkey toggles: stop instead of restarting, without paying
+            # for a selection read
+            if self.is_speaking:
+                logger.info("Already speaking - stopping current speech instead of restarting")
+                self.stop_speech()
+                return
+            
             # Get selected text using our improved method
             selected_text = self.get_selected_text()
             
             if selected_text:
                 logger.info(f"Found selected text, starting TTS: '{selected_text[:50]}...'")
-                
-                # If we're already speaking the same text, stop instead of restarting
-                if self.is_speaking:
-                    logger.info("Already speaking - stopping current speech instead of restarting")
-                    self.stop_speech()
-                    return
-                
-                cleaned_text = self._clean_text(selected_text)
-                if cleaned_text:
-                    self.speak_text(cleaned_text)
-                else:
-                    logger.warning("Selected text was empty after cleaning")
+                self.speak_text(selected_text)
             else:
                 # No text selected - stop current speech
                 logger.info("No text selected, stopping current speech")
@@ -375,7 +632,7 @@ class TextToSpeech:
         """Stop current speech synthesis and playback"""
         if self.is_speaking:
             logger.info("Stopping current speech")
-            self.stop_requested = True
+            self.stop_event.set()
             
             # Stop pygame mixer
             if pygame.mixer.music.get_busy():
@@ -412,6 +669,7 @@ class TextToSpeech:
     def cleanup(self):
         """Clean up resources"""
         self.stop_speech()
+        self.loop.call_soon_threadsafe(self.loop.stop)
         try:
             pygame.mixer.quit()
         except:
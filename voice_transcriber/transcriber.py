@@ -1,18 +1,66 @@
 """Speech-to-text transcription using OpenAI Whisper."""
 
+import concurrent.futures
+import importlib.util
 import logging
 import os
 import threading
 import time
+from math import gcd
 from typing import Optional
-import whisper
 
-from .config import config
+# Size the OpenMP/MKL pools before torch loads them. Using every logical
+# core makes hyperthreads contend during CPU inference, so default to half.
+# The imports below must come after this, hence the E402 suppressions
+if hasattr(os, "sched_getaffinity"):
+    _cpu_count = len(os.sched_getaffinity(0))
+else:
+    _cpu_count = os.cpu_count() or 1
+DEFAULT_NUM_THREADS = max(_cpu_count // 2, 1)
+os.environ.setdefault("OMP_NUM_THREADS", str(DEFAULT_NUM_THREADS))
+os.environ.setdefault("MKL_NUM_THREADS", os.environ["OMP_NUM_THREADS"])
+
+import numpy as np  # noqa: E402
+import torch  # noqa: E402
+import whisper  # noqa: E402
+from scipy.io import wavfile  # noqa: E402
+from scipy.signal import resample_poly  # noqa: E402
+
+from .config import config  # noqa: E402
 
 
 logger = logging.getLogger(__name__)
 
 
+def _omp_num_threads() -> int:
+    """Get the thread count from OMP_NUM_THREADS, or the default if it isn't a positive integer."""
+    try:
+        num_threads = int(os.environ["OMP_NUM_THREADS"])
+    except ValueError:
+        # e.g. "" or a nested-parallelism list like "4,2"
+        logger.warning(f"Ignoring invalid OMP_NUM_THREADS={os.environ['OMP_NUM_THREADS']!r}")
+        return DEFAULT_NUM_THREADS
+    return num_threads if num_threads > 0 else DEFAULT_NUM_THREADS
+
+
+# Whisper runs one decode at a time, so a single inter-op thread is enough
+torch.set_num_threads(_omp_num_threads())
+try:
+    torch.set_num_interop_threads(1)
+except RuntimeError:
+    # Only allowed before torch runs any parallel work
+    logger.debug("torch inter-op thread count already fixed")
+
+# Whisper models are trained on 16 kHz mono audio
+WHISPER_SAMPLE_RATE = 16000
+
+# Unload the model after this many seconds without a transcription
+MODEL_IDLE_TIMEOUT = 300
+
+# Pinned Silero VAD release, fetched through torch.hub only when the VAD is enabled
+SILERO_VAD_REPO = 'snakers4/silero-vad:v5.1.2'
+
+
 class Transcriber:
     """Handles speech-to-text transcription using OpenAI Whisper."""
     
@@ -21,30 +69,32 @@ class Transcriber:
         self.model_load_time = 0
         self.model_lock = threading.Lock()
         self.last_used = 0
+        # time.monotonic() of the last use, for the idle check; last_used
+        # stays wall-clock time for get_model_info()
+        self.last_activity = 0.0
+        self.device = "cuda" if torch.cuda.is_available() else "cpu"
+        self.backend = self._select_backend()
+        self.vad_model = None
+        self.vad_utils = None
+        self.vad_lock = threading.Lock()
+        
+        # Fires once the model has been idle for MODEL_IDLE_TIMEOUT; set up
+        # before the loader starts because warmup() arms it
+        self.unload_timer = None
+        self.unload_timer_lock = threading.Lock()
         
-        # Start model unloader thread
-        self.unloader_thread = threading.Thread(target=self._model_unloader, daemon=True)
-        self.unloader_thread.start()
+        # Load and warm up the model in the background so the first
+        # recording doesn't pay the model load latency
+        self.loader_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="whisper-loader"
+        )
+        self.load_future = self.loader_pool.submit(self.warmup)
     
     def transcribe(self, audio_file: str) -> Optional[str]:
         """Transcribe audio file to text."""
         try:
-            # Load model if needed
-            if not self._ensure_model_loaded():
-                return None
-            
-            self.last_used = time.time()
-            
-            # Transcribe audio
             logger.info(f"Transcribing audio file: {audio_file}")
-            start_time = time.time()
-            
-            result = self.model.transcribe(audio_file)
-            
-            transcription_time = time.time() - start_time
-            text = result["text"].strip()
-            
-            logger.info(f"Transcription completed in {transcription_time:.2f}s: '{text}'")
+            text = self._transcribe(self._load_audio_file(audio_file))
             
             # Clean up temporary file
             try:
@@ -52,24 +102,193 @@ class Transcriber:
             except Exception as e:
                 logger.warning(f"Failed to remove temporary file {audio_file}: {e}")
             
-            return text if text else None
+            return text
+            
+        except Exception as e:
+            logger.error(f"Transcription failed: {e}")
+            return None
+    
+    def transcribe_array(self, audio: np.ndarray, sample_rate: int = WHISPER_SAMPLE_RATE) -> Optional[str]:
+        """Transcribe in-memory audio samples to text."""
+        try:
+            logger.info(f"Transcribing {len(audio) / sample_rate:.2f}s of audio")
+            return self._transcribe(self._prepare_audio(audio, sample_rate))
             
         except Exception as e:
             logger.error(f"Transcription failed: {e}")
             return None
     
+    def _transcribe(self, audio) -> Optional[str]:
+        """Run Whisper on a file path or float32 array at 16 kHz."""
+        # Wait for the initial background load and warmup to finish
+        self.load_future.result()
+        
+        # Drop silence before the heavy model; an empty result means the
+        # hotkey was pressed without speaking
+        silence_trimmed = False
+        if self.vad_model is not None and isinstance(audio, np.ndarray):
+            audio = self._trim_silence(audio)
+            if audio is None:
+                logger.info("No speech detected, skipping transcription")
+                return None
+            silence_trimmed = True
+        
+        # Load model if needed (e.g. after it was unloaded)
+        if not self._ensure_model_loaded():
+            return None
+        
+        # Keeps a timer firing mid-transcription from unloading the model
+        self.last_activity = time.monotonic()
+        self.last_used = time.time()
+        start_time = time.time()
+        
+        # faster-whisper's own VAD is only needed when Silero didn't run here
+        result = self._run_model(audio, vad_filter=config.use_vad and not silence_trimmed)
+        self._mark_used()
+        
+        transcription_time = time.time() - start_time
+        text = result["text"].strip()
+        
+        logger.info(f"Transcription completed in {transcription_time:.2f}s: '{text}'")
+        return text if text else None
+    
+    def _load_audio_file(self, audio_file: str):
+        """Decode WAV files in-process; leave other formats to Whisper."""
+        if not audio_file.lower().endswith('.wav'):
+            # Whisper decodes other formats with an ffmpeg subprocess
+            return audio_file
+        
+        sample_rate, audio = wavfile.read(audio_file)
+        return self._prepare_audio(audio, sample_rate)
+    
+    @staticmethod
+    def _prepare_audio(audio: np.ndarray, sample_rate: int) -> np.ndarray:
+        """Convert samples to the mono float32 16 kHz array Whisper expects."""
+        if audio.dtype == np.uint8:
+            # 8-bit PCM WAV is unsigned and centred on 128
+            audio = (audio.astype(np.float32) - 128) / 128
+        elif np.issubdtype(audio.dtype, np.integer):
+            audio = audio.astype(np.float32) / -float(np.iinfo(audio.dtype).min)
+        else:
+            audio = audio.astype(np.float32, copy=False)
+        
+        # Downmix to mono
+        if audio.ndim > 1:
+            audio = audio.mean(axis=1)
+        
+        if sample_rate != WHISPER_SAMPLE_RATE:
+            divisor = gcd(sample_rate, WHISPER_SAMPLE_RATE)
+            audio = resample_poly(
+                audio, WHISPER_SAMPLE_RATE // divisor, sample_rate // divisor
+            ).astype(np.float32)
+        
+        return audio
+    
+    def _trim_silence(self, audio: np.ndarray) -> Optional[np.ndarray]:
+        """Keep only the speech segments of a 16 kHz clip, or None if there are none."""
+        get_speech_timestamps, _, _, _, collect_chunks = self.vad_utils
+        wav = torch.from_numpy(audio)
+        
+        # The VAD model keeps recurrent state between calls
+        with self.vad_lock, torch.inference_mode():
+            speech_timestamps = get_speech_timestamps(
+                wav, self.vad_model, sampling_rate=WHISPER_SAMPLE_RATE
+            )
+        
+        if not speech_timestamps:
+            return None
+        
+        return collect_chunks(speech_timestamps, wav).numpy()
+    
+    def _load_vad(self):
+        """Load the pinned Silero VAD release, downloading it on first use."""
+        try:
+            start_time = time.time()
+            self.vad_model, self.vad_utils = torch.hub.load(
+                repo_or_dir=SILERO_VAD_REPO,
+                model='silero_vad',
+                trust_repo=True
+            )
+            logger.info(f"VAD model loaded in {time.time() - start_time:.2f}s")
+            
+        except Exception as e:
+            # Transcription still works without it, just on the full clip
+            logger.warning(f"Failed to load VAD model, transcribing without it: {e}")
+            self.vad_model = None
+    
+    def warmup(self) -> bool:
+        """Load the model and run one second of silence through it."""
+        if config.use_vad:
+            self._load_vad()
+        
+        if not self._ensure_model_loaded():
+            return False
+        
+        try:
+            start_time = time.time()
+            silence = np.zeros(WHISPER_SAMPLE_RATE, dtype=np.float32)
+            # Without the VAD, or faster-whisper would drop the silence and
+            # never actually run the model
+            self._run_model(silence, vad_filter=False)
+            self._mark_used()
+            logger.info(f"Model warmed up in {time.time() - start_time:.2f}s")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Model warmup failed: {e}")
+            return False
+    
+    def _select_backend(self) -> str:
+        """Get the configured backend, falling back if it isn't installed."""
+        if config.whisper_backend == "faster":
+            if importlib.util.find_spec("faster_whisper") is not None:
+                return "faster"
+            logger.warning("faster-whisper is not installed, using openai-whisper")
+        return "openai"
+    
+    def _run_model(self, audio, vad_filter: bool = False) -> dict:
+        """Run Whisper inference without autograd bookkeeping."""
+        if self.backend == "faster":
+            # Greedy decoding like openai-whisper's default; the built-in
+            # VAD optionally skips silent stretches
+            segments, _ = self.model.transcribe(
+                audio,
+                beam_size=1,
+                vad_filter=vad_filter,
+                condition_on_previous_text=False
+            )
+            return {"text": "".join(segment.text for segment in segments)}
+        
+        with torch.inference_mode():
+            return self.model.transcribe(
+                audio,
+                # FP16 only helps on GPU; on CPU Whisper would warn and fall back
+                fp16=self.device == "cuda",
+                # Dictation clips are short, so skip conditioning on prior segments
+                condition_on_previous_text=False
+            )
+    
     def _ensure_model_loaded(self) -> bool:
         """Ensure the Whisper model is loaded."""
         with self.model_lock:
             if self.model is None:
                 try:
-                    logger.info(f"Loading Whisper model: {config.model_name}")
+                    logger.info(f"Loading Whisper model: {config.model_name} ({self.backend})")
                     start_time = time.time()
                     
-                    self.model = whisper.load_model(
-                        config.model_name,
-                        download_root=config.model_cache_dir
-                    )
+                    if self.backend == "faster":
+                        from faster_whisper import WhisperModel
+                        self.model = WhisperModel(
+                            config.model_name,
+                            device=self.device,
+                            compute_type="int8_float16" if self.device == "cuda" else "int8"
+                        )
+                    else:
+                        self.model = whisper.load_model(
+                            config.model_name,
+                            device=self.device,
+                            download_root=config.model_cache_dir
+                        )
                     
                     self.model_load_time = time.time() - start_time
                     logger.info(f"Model loaded in {self.model_load_time:.2f}s")
@@ -81,19 +300,36 @@ class Transcriber:
             
             return True
     
-    def _model_unloader(self):
+    def _mark_used(self):
+        """Record model use and restart the inactivity timer."""
+        self.last_used = time.time()
+        self.last_activity = time.monotonic()
+        self._schedule_unload()
+    
+    def _schedule_unload(self, delay: float = MODEL_IDLE_TIMEOUT):
+        """Restart the inactivity timer that unloads the model."""
+        with self.unload_timer_lock:
+            if self.unload_timer is not None:
+                self.unload_timer.cancel()
+            self.unload_timer = threading.Timer(delay, self._maybe_unload)
+            self.unload_timer.daemon = True
+            self.unload_timer.start()
+    
+    def _maybe_unload(self):
         """Unload model after period of inactivity to free memory."""
-        while True:
-            time.sleep(30)  # Check every 30 seconds
+        with self.model_lock:
+            if self.model is None or self.last_used == 0:
+                return
             
-            with self.model_lock:
-                if (self.model is not None and 
-                    self.last_used > 0 and 
-                    time.time() - self.last_used > 300):  # 5 minutes of inactivity
-                    
-                    logger.info("Unloading Whisper model due to inactivity")
-                    self.model = None
-                    self.last_used = 0
+            remaining = MODEL_IDLE_TIMEOUT - (time.monotonic() - self.last_activity)
+            if remaining <= 0:
+                logger.info("Unloading Whisper model due to inactivity")
+                self.model = None
+                self.last_used = 0
+                return
+        
+        # Used again since this timer was armed; wait out the rest
+        self._schedule_unload(remaining)
     
     def is_model_loaded(self) -> bool:
         """Check if model is currently loaded."""
@@ -104,6 +340,9 @@ class Transcriber:
         """Get information about the model."""
         return {
             "model_name": config.model_name,
+            "device": self.device,
+            "backend": self.backend,
+            "vad_enabled": self.vad_model is not None,
             "is_loaded": self.is_model_loaded(),
             "load_time": self.model_load_time,
             "last_used": self.last_used